@@ -13,11 +13,12 @@
 # ----------------------------------------------------------------------
 """Organizes artifacts into a format suitable for publishing."""
 
-import os
 import re
 import shutil
+import stat
 import textwrap
 
+from operator import itemgetter
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -87,31 +88,29 @@ def Organize(
     with DoneManager.CreateCommandLine(
         flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
     ) as dm:
-        all_filenames: list[Path] = []
-
-        with dm.Nested(
-            "Collecting build artifacts...",
-            lambda: "{} found".format(inflect.no("file", len(all_filenames))),
-        ):
-            for root, _, walk_filenames in os.walk(stage_dir):
-                if not walk_filenames:
-                    continue
-
-                root_path = Path(root)
-
-                for walk_filename in walk_filenames:
-                    all_filenames.append(root_path / walk_filename)
-
         # Organize the files
         wheel_name: Optional[str] = None
         wheel_version: Optional[str] = None
-        all_files: dict[str, list[Path]] = {}
+        all_files: dict[str, list[tuple[int, Path]]] = {}
 
-        with dm.Nested("Organizing files...") as organize_dm:
+        num_files = 0
+
+        with dm.Nested(
+            "Organizing build artifacts...",
+            lambda: "{} found".format(inflect.no("file", num_files)),
+        ) as organize_dm:
             python_version_regex = re.compile(r"^(?P<name>.+)-(?P<version>.+?)-py.+$")
 
-            for filename in all_filenames:
-                all_files.setdefault(filename.name, []).append(filename)
+            for filename in stage_dir.rglob("*"):
+                # Stat each file once; the size is used to sort the candidates below
+                file_stat = filename.stat()
+
+                if stat.S_ISDIR(file_stat.st_mode):
+                    continue
+
+                num_files += 1
+
+                all_files.setdefault(filename.name, []).append((file_stat.st_size, filename))
 
                 if filename.suffix == ".whl":
                     match = python_version_regex.match(filename.name)
@@ -142,7 +141,7 @@ def Organize(
                         assert False, (wheel_name, wheel_version)
 
             for filenames in all_files.values():
-                filenames.sort(key=lambda f: f.stat().st_size)
+                filenames.sort(key=itemgetter(0))
 
         if minisign_private_key:
             with dm.Nested("Preserving Minisign private key file..."):
@@ -162,7 +161,7 @@ def Organize(
                 dest_dir.mkdir(parents=True, exist_ok=True)
 
                 for filenames in all_files.values():
-                    filename = filenames[0]
+                    filename = filenames[0][1]
 
                     with copy_dm.Nested("Copying '{}'...".format(filename.name)) as this_copy_dm:
                         dest_filename = dest_dir / filename.name
@@ -181,9 +180,9 @@ def Organize(
                                     filename.name,
                                     "\n".join(
                                         "    {}) [{}] {}".format(
-                                            index + 1, PathEx.GetSizeDisplay(f), f
+                                            index + 1, PathEx.GetSizeDisplay(size), f
                                         )
-                                        for index, f in enumerate(filenames)
+                                        for index, (size, f) in enumerate(filenames)
                                     ),
                                 ),
                             )
@@ -23,7 +23,6 @@ from typing import Callable, Generator, Optional, Protocol
 
 import git
 
-from AutoGitSemVer.Lib import GetSemanticVersion  # type: ignore [import-untyped]
 from dbrownell_Common.ContextlibEx import ExitStack  # type: ignore [import-untyped]
 from dbrownell_Common import PathEx  # type: ignore [import-untyped]
 from dbrownell_Common.Streams.DoneManager import DoneManager  # type: ignore[import-untyped]
@@ -38,6 +37,9 @@ def UpdateVersion(
     version_filename: Path,
     version_replacement_func: Callable[[str, SemVer], str],
 ) -> None:
+    # Importing AutoGitSemVer is relatively expensive and only needed here
+    from AutoGitSemVer.Lib import GetSemanticVersion  # type: ignore [import-untyped]
+
     semantic_version: Optional[SemVer] = None
 
     with dm.Nested("Calculating version...") as version_dm:
@@ -22,9 +22,10 @@ from pathlib import Path
 from typing import Callable, Optional
 
 from dbrownell_Common.ContextlibEx import ExitStack  # type: ignore[import-untyped]
-from dbrownell_Common.InflectEx import inflect  # type: ignore[import-untyped]
 from dbrownell_Common import PathEx  # type: ignore[import-untyped]
+from dbrownell_Common.Streams.Capabilities import Capabilities  # type: ignore[import-untyped]
 from dbrownell_Common.Streams.DoneManager import DoneManager, DoneManagerException  # type: ignore[import-untyped]
+from dbrownell_Common.Streams.StreamDecorator import TextWriterT  # type: ignore[import-untyped]
 from dbrownell_Common import SubprocessEx  # type: ignore[import-untyped]
 
 if sys.version_info >= (3, 11):
@@ -40,21 +41,41 @@ def Black(
     *,
     format_sources: bool = False,
     args: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
 ) -> None:
     """Runs black on the python code"""
 
     with dm.Nested("Running black...") as black_dm:
-        command_line = 'black {}{}{}"{}"'.format(
-            "" if format_sources else "--check ",
-            "--verbose " if black_dm.is_verbose else "",
-            f"{args} " if args else "",
-            repo_root,
-        )
+        env: Optional[dict[str, str]] = None
+
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # black skips files whose size, modification time, and hash are unchanged since the
+            # previous run
+            env = {**os.environ, "BLACK_CACHE_DIR": str(cache_dir)}
+
+        command_line_parts = ["black"]
+
+        if not format_sources:
+            command_line_parts.append("--check")
+        if black_dm.is_verbose:
+            command_line_parts.append("--verbose")
+        if args:
+            command_line_parts.append(args)
+
+        command_line_parts.append(f'"{repo_root}"')
+
+        command_line = " ".join(command_line_parts)
 
         black_dm.WriteVerbose(f"Command Line: {command_line}\n\n")
 
         with black_dm.YieldStream() as stream:
-            black_dm.result = SubprocessEx.Stream(command_line, stream)
+            black_dm.result = SubprocessEx.Stream(
+                command_line,
+                _LineBufferedStream(stream),
+                env=env,
+            )
 
 
 # ----------------------------------------------------------------------
@@ -64,21 +85,38 @@ def Pylint(
     min_score: float = 9.5,
     *,
     args: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
 ) -> None:
     """Runs pylint on the python code"""
 
     with dm.Nested("Running pylint...") as pylint_dm:
-        command_line = 'pylint --fail-under={} {}{}"{}"'.format(
-            min_score,
-            "--verbose " if pylint_dm.is_verbose else "",
-            f"{args} " if args else "",
-            package_root,
-        )
+        env: Optional[dict[str, str]] = None
+
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # pylint persists its data between runs in this directory
+            env = {**os.environ, "PYLINTHOME": str(cache_dir)}
+
+        command_line_parts = ["pylint", f"--fail-under={min_score}"]
+
+        if pylint_dm.is_verbose:
+            command_line_parts.append("--verbose")
+        if args:
+            command_line_parts.append(args)
+
+        command_line_parts.append(f'"{package_root}"')
+
+        command_line = " ".join(command_line_parts)
 
         pylint_dm.WriteVerbose(f"Command Line: {command_line}\n\n")
 
         with pylint_dm.YieldStream() as stream:
-            pylint_dm.result = SubprocessEx.Stream(command_line, stream)
+            pylint_dm.result = SubprocessEx.Stream(
+                command_line,
+                _LineBufferedStream(stream),
+                env=env,
+            )
 
 
 # ----------------------------------------------------------------------
@@ -98,19 +136,30 @@ def Pytest(
         code_coverage = True
 
     with dm.Nested("Running pytest...") as pytest_dm:
-        command_line = "pytest {}{}{} --capture=no --verbose -vv {} .".format(
-            "--benchmark-skip " if not run_benchmarks else "",
-            f"--cov={python_package_name} " if code_coverage else "",
-            f"--cov-fail-under={min_coverage} " if min_coverage is not None else "",
-            args or "",
-        )
+        command_line_parts = ["pytest"]
+
+        if not run_benchmarks:
+            command_line_parts.append("--benchmark-skip")
+        if code_coverage:
+            command_line_parts.append(f"--cov={python_package_name}")
+        if min_coverage is not None:
+            command_line_parts.append(f"--cov-fail-under={min_coverage}")
+
+        command_line_parts += ["--capture=no", "--verbose", "-vv"]
+
+        if args:
+            command_line_parts.append(args)
+
+        command_line_parts.append(".")
+
+        command_line = " ".join(command_line_parts)
 
         pytest_dm.WriteVerbose(f"Command Line: {command_line}\n\n")
 
         with pytest_dm.YieldStream() as stream:
             pytest_dm.result = SubprocessEx.Stream(
                 command_line,
-                stream,
+                _LineBufferedStream(stream),
                 cwd=repo_root,
             )
 
@@ -198,14 +247,19 @@ def Package(
 
     with ExitStack(restore_readme_file_func):
         with dm.Nested("Packaging...") as package_dm:
-            command_line = "python -m build {}".format(args or "")
+            command_line_parts = ["python", "-m", "build"]
+
+            if args:
+                command_line_parts.append(args)
+
+            command_line = " ".join(command_line_parts)
 
             package_dm.WriteVerbose(f"Command Line: {command_line}\n\n")
 
             with package_dm.YieldStream() as stream:
                 package_dm.result = SubprocessEx.Stream(
                     command_line,
-                    stream,
+                    _LineBufferedStream(stream),
                     cwd=repo_root,
                 )
 
@@ -230,25 +284,53 @@ def Publish(
             )
         )
 
+    # Resolve the wheels here rather than relying on twine to expand the glob, so that a missing
+    # wheel results in a meaningful error.
+    wheel_filenames = sorted(dist_dir.glob("*.whl"))
+
+    if not wheel_filenames:
+        raise DoneManagerException(
+            "No wheels were found in '{}'. Please make sure that the package has been built before invoking this functionality.".format(
+                dist_dir
+            )
+        )
+
     if production:
         repository_url = "https://upload.PyPi.org/legacy/"
     else:
         repository_url = "https://test.PyPi.org/legacy/"
 
     with dm.Nested("Publishing to '{}'...".format(repository_url)) as publish_dm:
-        command_line = 'twine upload --repository-url {} --username __token__ --password {} --non-interactive --disable-progress-bar {} {}"dist/*.whl"'.format(
+        command_line_parts = [
+            "twine",
+            "upload",
+            "--repository-url",
             repository_url,
+            "--username",
+            "__token__",
+            "--password",
             pypi_api_token,
-            "--verbose" if publish_dm.is_verbose else "",
-            f"{args} " if args else "",
-        )
+            "--non-interactive",
+            "--disable-progress-bar",
+        ]
+
+        if publish_dm.is_verbose:
+            command_line_parts.append("--verbose")
+        if args:
+            command_line_parts.append(args)
+
+        command_line_parts += [
+            f'"dist/{wheel_filename.name}"' for wheel_filename in wheel_filenames
+        ]
+
+        command_line = " ".join(command_line_parts)
 
         publish_dm.WriteVerbose(f"Command Line: {command_line}\n\n")
 
         with publish_dm.YieldStream() as stream:
             publish_dm.result = SubprocessEx.Stream(
                 command_line,
-                stream,
+                _LineBufferedStream(stream),
                 cwd=repo_root,
             )
 
@@ -261,6 +343,9 @@ def BuildBinary(
 ) -> None:
     """Builds a python binary"""
 
+    # Importing inflect is relatively expensive and only needed here
+    from dbrownell_Common.InflectEx import inflect  # type: ignore[import-untyped]
+
     with dm.Nested("Building binary...") as build_dm:
         with build_dm.Nested("Building executable...") as build_exe_dm:
             command_line = f"python {build_filename.name} build_exe"
@@ -310,3 +395,50 @@ def BuildBinary(
             )
 
             shutil.rmtree(build_dir)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+class _LineBufferedStream:
+    """\
+    Coalesces the (potentially single character) writes generated by `SubprocessEx.Stream` into
+    line-sized writes, as each write to a DoneManager stream is relatively expensive.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        stream: TextWriterT,
+    ):
+        self._stream = stream
+        self._buffer: list[str] = []
+
+        Capabilities.Set(self, Capabilities.Get(stream))
+
+    # ----------------------------------------------------------------------
+    def write(
+        self,
+        content: str,
+    ) -> int:
+        self._buffer.append(content)
+
+        if content.endswith(("\n", "\r")):
+            self._Flush()
+
+        return len(content)
+
+    # ----------------------------------------------------------------------
+    def flush(self) -> None:
+        self._Flush()
+        self._stream.flush()
+
+    # ----------------------------------------------------------------------
+    def isatty(self) -> bool:
+        return self._stream.isatty()
+
+    # ----------------------------------------------------------------------
+    def _Flush(self) -> None:
+        if self._buffer:
+            self._stream.write("".join(self._buffer))
+            self._buffer = []
@@ -13,29 +13,94 @@
 # ----------------------------------------------------------------------
 """Implement tasks used when working with Python repositories."""
 
+import functools
+import io
+import itertools
 import re
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Callable, Optional
+from typing import Annotated, Callable, Optional, TYPE_CHECKING
 
 from dbrownell_Common import PathEx  # type: ignore [import-untyped]
 from dbrownell_Common.Streams.DoneManager import DoneManager, Flags as DoneManagerFlags  # type: ignore [import-untyped]
-from semantic_version import Version as SemVer  # type: ignore [import-untyped]
 import typer
 
 from dbrownell_DevTools import BuildActivities
 from dbrownell_DevTools import PythonBuildActivities
 
+if TYPE_CHECKING:
+    from semantic_version import Version as SemVer  # type: ignore [import-untyped]
+
 
 # ----------------------------------------------------------------------
 # |
 # |  Private Types
 # |
 # ----------------------------------------------------------------------
+_version_regex = re.compile(r"^__version__\s*=\s*.*$", re.MULTILINE)
+
 _verbose_typer_option = typer.Option("--verbose", help="Write verbose information to the terminal.")
 _debug_typer_option = typer.Option("--debug", help="Write debug information to the terminal.")
 
+_black_format_typer_option = typer.Option(
+    "--format",
+    help="Format the files; the default behavior checks if any files need to be formatted.",
+)
+_black_cache_dir_typer_option = typer.Option(
+    "--cache-dir",
+    file_okay=False,
+    resolve_path=True,
+    help="Directory used by black to cache information about unchanged files (this directory can be saved/restored by CI).",
+)
+_black_args_typer_option = typer.Option("--args", help="Additional arguments passed to black.")
+
+_pylint_min_score_typer_option = typer.Option(
+    "--min-score",
+    min=0.0,
+    max=10.0,
+    help="Fail if the total score is less than this value.",
+)
+_pylint_cache_dir_typer_option = typer.Option(
+    "--cache-dir",
+    file_okay=False,
+    resolve_path=True,
+    help="Directory used to persist pylint data between runs (this directory can be saved/restored by CI).",
+)
+_pylint_args_typer_option = typer.Option("--args", help="Additional arguments passed to pylint.")
+
+_pytest_code_coverage_typer_option = typer.Option(
+    "--code-coverage", help="Run tests with code coverage information."
+)
+_pytest_benchmark_typer_option = typer.Option(
+    "--benchmark", help="Run benchmark tests in addition to other tests."
+)
+_pytest_jobs_typer_option = typer.Option(
+    "--jobs",
+    "-n",
+    help="Run tests in parallel with this many pytest-xdist workers ('auto' uses one worker per CPU, 0 disables parallel execution); ignored when running benchmarks.",
+)
+_pytest_args_typer_option = typer.Option("--args", help="Additional arguments passed to pytest.")
+
+_package_args_typer_option = typer.Option("--args", help="Additional arguments passed to build.")
+
+_publish_pypi_api_token_typer_argument = typer.Argument(
+    help="API token (generated on PyPi.org or test.PyPi.org); the token should be scoped to this project only."
+)
+_publish_production_typer_option = typer.Option(
+    "--production", help="Push to the PyPi.org rather than test.PyPi.org."
+)
+_publish_args_typer_option = typer.Option(
+    "--args", help="Additional arguments based to the publish command."
+)
+
+_build_binaries_jobs_typer_option = typer.Option(
+    "--jobs",
+    min=1,
+    help="Number of binaries to build concurrently; binaries whose build files share a directory are always built one at a time.",
+)
+
 
 # ----------------------------------------------------------------------
 # |
@@ -51,19 +116,10 @@ def BlackFuncFactory(
     @app.command("black", no_args_is_help=False)
     def Black(
         format: Annotated[  # pylint: disable=redefined-builtin
-            bool,
-            typer.Option(
-                "--format",
-                help="Format the files; the default behavior checks if any files need to be formatted.",
-            ),
+            bool, _black_format_typer_option
         ] = False,
-        black_args: Annotated[
-            Optional[str],
-            typer.Option(
-                "--args",
-                help="Additional arguments passed to black.",
-            ),
-        ] = None,
+        cache_dir: Annotated[Optional[Path], _black_cache_dir_typer_option] = None,
+        black_args: Annotated[Optional[str], _black_args_typer_option] = None,
         verbose: Annotated[bool, _verbose_typer_option] = False,
         debug: Annotated[bool, _debug_typer_option] = False,
     ) -> None:
@@ -86,6 +142,7 @@ def BlackFuncFactory(
                 repo_root,
                 format_sources=format,
                 args=optional_args,
+                cache_dir=cache_dir,
             )
 
     # ----------------------------------------------------------------------
@@ -103,22 +160,9 @@ def PylintFuncFactory(
     # ----------------------------------------------------------------------
     @app.command("pylint", no_args_is_help=False)
     def Pylint(
-        min_score: Annotated[
-            float,
-            typer.Option(
-                "--min-score",
-                min=0.0,
-                max=10.0,
-                help="Fail if the total score is less than this value.",
-            ),
-        ] = default_min_score,
-        pylint_args: Annotated[
-            Optional[str],
-            typer.Option(
-                "--args",
-                help="Additional arguments passed to pylint.",
-            ),
-        ] = None,
+        min_score: Annotated[float, _pylint_min_score_typer_option] = default_min_score,
+        cache_dir: Annotated[Optional[Path], _pylint_cache_dir_typer_option] = None,
+        pylint_args: Annotated[Optional[str], _pylint_args_typer_option] = None,
         verbose: Annotated[bool, _verbose_typer_option] = False,
         debug: Annotated[bool, _debug_typer_option] = False,
     ) -> None:
@@ -141,6 +185,7 @@ def PylintFuncFactory(
                 package_root,
                 min_score,
                 args=optional_args,
+                cache_dir=cache_dir,
             )
 
     # ----------------------------------------------------------------------
@@ -159,28 +204,34 @@ def PytestFuncFactory(
     # ----------------------------------------------------------------------
     @app.command("pytest", no_args_is_help=False)
     def Pytest(
-        code_coverage: Annotated[
-            bool,
-            typer.Option("--code-coverage", help="Run tests with code coverage information."),
-        ] = False,
-        benchmark: Annotated[
-            bool,
-            typer.Option("--benchmark", help="Run benchmark tests in addition to other tests."),
-        ] = False,
-        pytest_args: Annotated[
-            Optional[str],
-            typer.Option("--args", help="Additional arguments passed to pytest."),
-        ] = None,
+        *,
+        code_coverage: Annotated[bool, _pytest_code_coverage_typer_option] = False,
+        benchmark: Annotated[bool, _pytest_benchmark_typer_option] = False,
+        jobs: Annotated[Optional[str], _pytest_jobs_typer_option] = None,
+        pytest_args: Annotated[Optional[str], _pytest_args_typer_option] = None,
         verbose: Annotated[bool, _verbose_typer_option] = False,
         debug: Annotated[bool, _debug_typer_option] = False,
     ) -> None:
         """Runs pytest on the python tests."""
 
+        if jobs is not None and jobs != "auto" and not jobs.isdigit():
+            raise typer.BadParameter(
+                f"'{jobs}' is not a non-negative integer or 'auto'.",
+                param_hint="'--jobs' / '-n'",
+            )
+
         with DoneManager.CreateCommandLine(
             flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
         ) as dm:
             args = []
 
+            # Parallel workers (via pytest-xdist) perturb benchmark timings, so only use them when
+            # benchmarks are not being run. '--dist=loadfile' keeps the tests in a module on the same
+            # worker so that module-level fixtures are preserved. Consistent with pytest-xdist, 0
+            # disables parallel execution.
+            if jobs is not None and (jobs == "auto" or int(jobs) != 0) and not benchmark:
+                args.append(f"-n {jobs} --dist=loadfile")
+
             if additional_args:
                 args.append(additional_args)
             if pytest_args:
@@ -203,6 +254,86 @@ def PytestFuncFactory(
     return Pytest
 
 
+# ----------------------------------------------------------------------
+def CheckFuncFactory(
+    repo_root: Path,  # given /src/<package_name>, repo_root is /
+    package_root: Path,  # given /src/<package_name>, package_root is /src/<package_name>
+    cov_name: str,
+    app: typer.Typer,
+    *,
+    default_min_score: float = 9.5,
+    default_min_coverage: float = 95.0,
+    black_additional_args: Optional[str] = None,
+    pylint_additional_args: Optional[str] = None,
+    pytest_additional_args: Optional[str] = None,
+) -> Callable:
+    # The arguments should match those provided to BlackFuncFactory, PylintFuncFactory, and
+    # PytestFuncFactory so that `check` validates the same things as the individual commands.
+
+    # ----------------------------------------------------------------------
+    @app.command("check", no_args_is_help=False)
+    def Check(
+        code_coverage: Annotated[bool, _pytest_code_coverage_typer_option] = False,
+        verbose: Annotated[bool, _verbose_typer_option] = False,
+        debug: Annotated[bool, _debug_typer_option] = False,
+    ) -> None:
+        """Runs black (in check mode), pylint, and pytest concurrently."""
+
+        flags = DoneManagerFlags.Create(verbose=verbose, debug=debug)
+
+        with DoneManager.CreateCommandLine(flags=flags) as dm:
+            with dm.Nested("Running black, pylint, and pytest..."):
+                with ThreadPoolExecutor(3) as executor:
+                    futures = [
+                        executor.submit(
+                            _ExecuteBuffered,
+                            "Black",
+                            flags,
+                            lambda this_dm: PythonBuildActivities.Black(
+                                this_dm,
+                                repo_root,
+                                args=black_additional_args,
+                            ),
+                        ),
+                        executor.submit(
+                            _ExecuteBuffered,
+                            "Pylint",
+                            flags,
+                            lambda this_dm: PythonBuildActivities.Pylint(
+                                this_dm,
+                                package_root,
+                                default_min_score,
+                                args=pylint_additional_args,
+                            ),
+                        ),
+                        executor.submit(
+                            _ExecuteBuffered,
+                            "Pytest",
+                            flags,
+                            lambda this_dm: PythonBuildActivities.Pytest(
+                                this_dm,
+                                repo_root,
+                                cov_name,
+                                default_min_coverage if code_coverage else None,
+                                args=pytest_additional_args,
+                                code_coverage=code_coverage,
+                            ),
+                        ),
+                    ]
+
+                    results = [future.result() for future in futures]
+
+            for result, output in results:
+                dm.WriteLine(output.rstrip())
+
+                if result != 0 and dm.result == 0:
+                    dm.result = result
+
+    # ----------------------------------------------------------------------
+
+    return Check
+
+
 # ----------------------------------------------------------------------
 def UpdateVersionFuncFactory(
     source_root: Path,  # given /src/<package_name>, source_root is /src
@@ -227,14 +358,12 @@ def UpdateVersionFuncFactory(
             # ----------------------------------------------------------------------
             def UpdateContent(
                 content: str,
-                semantic_version: SemVer,
+                semantic_version: "SemVer",
             ) -> str:
-                return re.sub(
-                    r"^__version__\s*=\s*.*$",
-                    '__version__ = "{}"'.format(semantic_version),
+                return _version_regex.sub(
+                    f'__version__ = "{semantic_version}"',
                     content,
                     count=1,
-                    flags=re.MULTILINE,
                 )
 
             # ----------------------------------------------------------------------
@@ -260,10 +389,7 @@ def PackageFuncFactory(
     # ----------------------------------------------------------------------
     @app.command("package", no_args_is_help=False)
     def Package(
-        package_args: Annotated[
-            Optional[str],
-            typer.Option("--args", help="Additional arguments passed to build."),
-        ] = None,
+        package_args: Annotated[Optional[str], _package_args_typer_option] = None,
         verbose: Annotated[bool, _verbose_typer_option] = False,
         debug: Annotated[bool, _debug_typer_option] = False,
     ) -> None:
@@ -301,20 +427,9 @@ def PublishFuncFactory(
     # ----------------------------------------------------------------------
     @app.command("publish", no_args_is_help=False)
     def Publish(
-        pypi_api_token: Annotated[
-            str,
-            typer.Argument(
-                help="API token (generated on PyPi.org or test.PyPi.org); the token should be scoped to this project only."
-            ),
-        ],
-        production: Annotated[
-            bool,
-            typer.Option("--production", help="Push to the PyPi.org rather than test.PyPi.org."),
-        ] = False,
-        publish_args: Annotated[
-            Optional[str],
-            typer.Option("--args", help="Additional arguments based to the publish command."),
-        ] = None,
+        pypi_api_token: Annotated[str, _publish_pypi_api_token_typer_argument],
+        production: Annotated[bool, _publish_production_typer_option] = False,
+        publish_args: Annotated[Optional[str], _publish_args_typer_option] = None,
         verbose: Annotated[bool, _verbose_typer_option] = False,
         debug: Annotated[bool, _debug_typer_option] = False,
     ) -> None:
@@ -380,7 +495,7 @@ def BuildBinariesFuncFactory(
     app: typer.Typer,
 ) -> Callable:
     # Create an enumeration of the build names
-    enum_type = Enum("BuildNames", {item: item for item in build_filenames})  # type: ignore
+    enum_type = _CreateBuildNamesEnum(tuple(build_filenames))
 
     # ----------------------------------------------------------------------
     @app.command("build_binaries", no_args_is_help=False)
@@ -388,6 +503,7 @@ def BuildBinariesFuncFactory(
         binary_names: Annotated[
             Optional[list[enum_type]], typer.Argument(help="The name of the binary to build.")  # type: ignore
         ] = None,
+        jobs: Annotated[int, _build_binaries_jobs_typer_option] = 1,
         verbose: Annotated[bool, _verbose_typer_option] = False,
         debug: Annotated[bool, _debug_typer_option] = False,
     ) -> None:
@@ -398,19 +514,69 @@ def BuildBinariesFuncFactory(
         with DoneManager.CreateCommandLine(
             flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
         ) as dm:
-            for index, build_enum in enumerate(binary_names):
-                build_name = build_enum.name
-                build_filename = build_filenames[build_name]
-
-                with dm.Nested(
-                    "Building '{}' ({} of {})...".format(build_name, index + 1, len(binary_names)),
-                    suffix="\n",
-                ) as this_dm:
-                    PythonBuildActivities.BuildBinary(
-                        this_dm,
-                        build_filename,
-                        repo_root / "build" / build_name,
+            # ----------------------------------------------------------------------
+            def GetHeading(
+                index: int,
+                build_name: str,
+            ) -> str:
+                return f"Building '{build_name}' ({index + 1} of {len(binary_names)})..."
+
+            # ----------------------------------------------------------------------
+            def Build(
+                build_name: str,
+                this_dm: DoneManager,
+            ) -> None:
+                PythonBuildActivities.BuildBinary(
+                    this_dm,
+                    build_filenames[build_name],
+                    repo_root / "build" / build_name,
+                )
+
+            # ----------------------------------------------------------------------
+
+            groups = (
+                None
+                if jobs == 1
+                else _GetConcurrentBuildGroups(
+                    repo_root,
+                    [build_filenames[build_enum.name] for build_enum in binary_names],
+                )
+            )
+
+            if groups is None:
+                for index, build_enum in enumerate(binary_names):
+                    with dm.Nested(GetHeading(index, build_enum.name), suffix="\n") as this_dm:
+                        Build(build_enum.name, this_dm)
+
+                return
+
+            # ----------------------------------------------------------------------
+            def BuildGroup(
+                indexes: list[int],
+            ) -> list[tuple[int, int, str]]:
+                return [
+                    (
+                        index,
+                        *_ExecuteBuffered(
+                            GetHeading(index, binary_names[index].name),
+                            dm.flags,
+                            functools.partial(Build, binary_names[index].name),
+                        ),
                     )
+                    for index in indexes
+                ]
+
+            # ----------------------------------------------------------------------
+
+            with ThreadPoolExecutor(jobs) as executor:
+                # Display the output in order once all of the builds have completed
+                for _, result, output in sorted(
+                    itertools.chain.from_iterable(executor.map(BuildGroup, groups))
+                ):
+                    dm.WriteLine(output)
+
+                    if result != 0 and dm.result == 0:
+                        dm.result = result
 
     # ----------------------------------------------------------------------
 
@@ -482,3 +648,54 @@ def CreateDockerImageFuncFactory(
     # ----------------------------------------------------------------------
 
     return CreateDockerImage
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=32)
+def _CreateBuildNamesEnum(
+    build_names: tuple[str, ...],
+) -> type[Enum]:
+    # Typer uses the enum values as the command line choices, so each value is the build name
+    return Enum("BuildNames", [(build_name, build_name) for build_name in build_names])  # type: ignore
+
+
+# ----------------------------------------------------------------------
+def _GetConcurrentBuildGroups(
+    repo_root: Path,
+    build_filenames: list[Path],
+) -> Optional[list[list[int]]]:
+    """Returns groups of build indexes that can be built concurrently, or None if the builds must run serially."""
+
+    # cx_Freeze writes to a 'build' directory alongside the build file, and that directory is moved
+    # to the output directory once the build completes. Builds whose files share a directory (and
+    # therefore a 'build' directory) must run one at a time. A build file in the repo root is built
+    # in the directory that contains every output directory, so nothing can run concurrently with it.
+    groups: dict[Path, list[int]] = {}
+
+    for index, build_filename in enumerate(build_filenames):
+        groups.setdefault(build_filename.parent, []).append(index)
+
+    if len(groups) == 1 or repo_root in groups:
+        return None
+
+    return list(groups.values())
+
+
+# ----------------------------------------------------------------------
+def _ExecuteBuffered(
+    heading: str,
+    flags: DoneManagerFlags,
+    func: Callable[[DoneManager], None],
+) -> tuple[int, str]:
+    # DoneManager instances are not thread-safe, so each concurrent task writes to its own buffer
+    # that is displayed by the caller once the task has completed.
+    sink = io.StringIO()
+
+    with DoneManager.Create(sink, heading, flags=flags) as dm:
+        func(dm)
+
+    return dm.result, sink.getvalue()
@@ -15,10 +15,13 @@
 # ----------------------------------------------------------------------
 """Updates the Gitmoji data"""
 
+import os
+import shutil
+
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated
 
-import requests  # type: ignore[import-untyped]
 import typer
 
 from typer.core import TyperGroup
@@ -26,6 +29,10 @@ from typer.core import TyperGroup
 from dbrownell_Common.Streams.DoneManager import DoneManager, Flags as DoneManagerFlags  # type: ignore[import-untyped]
 
 
+# ----------------------------------------------------------------------
+_BUFFER_SIZE = 64 * 1024
+
+
 # ----------------------------------------------------------------------
 class NaturalOrderGrouper(TyperGroup):
     # ----------------------------------------------------------------------
@@ -60,31 +67,54 @@ def Update(  # pylint: disable=dangerous-default-value
 ) -> None:
     """Updates the Gitmoji data."""
 
+    # requests is only needed when the command is invoked, not when the cli is displayed
+    import requests  # type: ignore[import-untyped]
+
+    from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+
     with DoneManager.CreateCommandLine(
         flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
     ) as dm:
         this_dir = Path(__file__).parent
 
-        for filename_index, filename in enumerate(filenames):
-            with dm.Nested(
-                "Downloading '{}' ({} of {})...".format(
-                    filename,
-                    filename_index + 1,
-                    len(filenames),
-                ),
-            ):
-                response = requests.get(  # pylint: disable=missing-timeout
-                    "{}/{}".format(url_base, filename)
-                )
-                response.raise_for_status()
-
-                content = response.text
-
-                with (this_dir / filename).open(
-                    "w",
-                    encoding="UTF-8",
-                ) as f:
-                    f.write(content)
+        with requests.Session() as session:
+            session.mount("https://", HTTPAdapter(pool_maxsize=max(1, len(filenames))))
+
+            # ----------------------------------------------------------------------
+            def Download(
+                filename: str,
+            ) -> None:
+                with session.get(
+                    f"{url_base}/{filename}",
+                    stream=True,
+                    timeout=(5, 30),
+                ) as response:
+                    response.raise_for_status()
+
+                    # Stream the (decompressed) bytes to a temporary file so that a failed download
+                    # doesn't leave a partially written file in place of the existing data
+                    response.raw.decode_content = True
+
+                    temp_filename = this_dir / f"{filename}.tmp"
+
+                    try:
+                        with temp_filename.open("wb", buffering=_BUFFER_SIZE) as f:
+                            shutil.copyfileobj(response.raw, f, length=_BUFFER_SIZE)
+
+                        os.replace(temp_filename, this_dir / filename)
+                    finally:
+                        temp_filename.unlink(missing_ok=True)
+
+            # ----------------------------------------------------------------------
+
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(filenames)))) as executor:
+                futures = [executor.submit(Download, filename) for filename in filenames]
+
+                for filename_index, (filename, future) in enumerate(zip(filenames, futures)):
+                    with dm.Nested(
+                        f"Downloading '{filename}' ({filename_index + 1} of {len(filenames)})...",
+                    ):
+                        future.result()
 
 
 # ----------------------------------------------------------------------
@@ -13,6 +13,7 @@
 # ----------------------------------------------------------------------
 """Tools to create and display emojis used when committing changes to a repository."""
 
+import functools
 import json
 import re
 import sys
@@ -20,7 +21,7 @@ import textwrap
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated, Match, Optional
+from typing import Annotated, Any, Match, Optional
 
 import typer
 
@@ -88,26 +89,7 @@ def Display(
                     show_footer=True,
                 )
 
-                for col_name, justify, footer in [
-                    ("Emoji", "center", None),
-                    (
-                        "Emoji Name",
-                        "center",
-                        Text(
-                            'add ":<name>:" to the commit message (e.g. ":tada:")',
-                            style="italic",
-                        ),
-                    ),
-                    ("Description", "left", None),
-                    (
-                        "Aliases",
-                        "left",
-                        Text(
-                            'add ":<alias>:" to the commit message (e.g. ":+feature:")',
-                            style="italic",
-                        ),
-                    ),
-                ]:
+                for col_name, justify, footer in _display_columns:
                     if not display_aliases and col_name == "Aliases":
                         continue
 
@@ -148,74 +130,70 @@ def Transform(
     else:
         message = message_or_filename
 
-    emojis = _CreateEmojiTables()
-
-    emoji_regex = re.compile(
-        textwrap.dedent(
-            r"""(?#
-            Whole match [start]             )(?P<whole_match>:(?#
-            Value                           )(?P<value>[^:]+)(?#
-            Whole match [end]               ):)(?#
-            )""",
-        ),
-    )
-
-    # Populate aliases
-    aliases: dict[str, str] = {}
-
-    for items in emojis.values():
-        for item in items:
-            for alias in item.aliases:
-                assert alias not in aliases, alias
-                aliases[alias] = item.code
+    substitutions = _CreateSubstitutions()
 
     # ----------------------------------------------------------------------
-    def SubstituteAlias(
+    def Substitute(
         match: Match,
     ) -> str:
-        alias = match.group("value")
-
-        emoji = aliases.get(alias, None)
-        if emoji is None:
+        try:
+            return substitutions[match.group("value")]
+        except KeyError:
             return match.group("whole_match")
 
-        return "{} [{}]".format(emoji, alias)
-
     # ----------------------------------------------------------------------
 
-    message = emoji_regex.sub(SubstituteAlias, message)
-
-    # Populate emojis
-    emoji_codes: dict[str, str] = {}
-
-    for items in emojis.values():
-        for item in items:
-            assert item.code not in emojis, item.code
-            emoji_codes[item.code] = item.emoji
-
-    # ----------------------------------------------------------------------
-    def SubstituteEmojis(
-        match: Match,
-    ) -> str:
-        whole_match = match.group("whole_match")
+    message = _emoji_regex.sub(Substitute, message)
 
-        emoji = emoji_codes.get(whole_match)
-        if emoji is None:
-            return whole_match
+    # Write the encoded message directly to the underlying buffer (when available) to bypass the
+    # text layer; the content is always UTF-8, regardless of the terminal's encoding.
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
 
-        return emoji
+    if stdout_buffer is None:
+        sys.stdout.write(message)
+    else:
+        sys.stdout.flush()
+        stdout_buffer.write(message.encode("UTF-8"))
+        stdout_buffer.flush()
 
-    # ----------------------------------------------------------------------
 
-    message = emoji_regex.sub(SubstituteEmojis, message)
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_display_columns: tuple[tuple[str, str, Optional[Text]], ...] = (
+    ("Emoji", "center", None),
+    (
+        "Emoji Name",
+        "center",
+        Text(
+            'add ":<name>:" to the commit message (e.g. ":tada:")',
+            style="italic",
+        ),
+    ),
+    ("Description", "left", None),
+    (
+        "Aliases",
+        "left",
+        Text(
+            'add ":<alias>:" to the commit message (e.g. ":+feature:")',
+            style="italic",
+        ),
+    ),
+)
 
-    sys.stdout.write(message)
+_emoji_regex = re.compile(
+    textwrap.dedent(
+        r"""(?#
+        Whole match [start]             )(?P<whole_match>:(?#
+        Value                           )(?P<value>[^:]+)(?#
+        Whole match [end]               ):)(?#
+        )""",
+    ),
+)
 
 
 # ----------------------------------------------------------------------
-# ----------------------------------------------------------------------
-# ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _EmojiInfo:
     name: str
     emoji: str
@@ -225,24 +203,13 @@ class _EmojiInfo:
 
 
 # ----------------------------------------------------------------------
+@functools.cache
 def _CreateEmojiTables() -> dict[
     Optional[str],  # Category, None implies un-categorized
     list[_EmojiInfo],
 ]:
-    this_path = Path(__file__).parent
-
     # Read the emoji data
-    data_filename = this_path / "Gitmoji" / "gitmojis.json"
-    assert data_filename.is_file(), data_filename
-
-    with data_filename.open(
-        "r",
-        encoding="UTF-8",
-    ) as f:
-        data_content = json.load(f)
-
-    assert "gitmojis" in data_content, data_content.keys()
-    data_content = data_content["gitmojis"]
+    data_content = _ReadGitmojiData()
 
     # ----------------------------------------------------------------------
     @dataclass(frozen=True)
@@ -262,20 +229,10 @@ def _CreateEmojiTables() -> dict[
         for data in data_content
     }
 
-    # Read the category data
-    categories_filename = this_path / "categories.json"
-    assert categories_filename.is_file(), categories_filename
-
-    with categories_filename.open(
-        "r",
-        encoding="UTF-8",
-    ) as f:
-        category_content = json.load(f)
-
     # Produce the results
     results: dict[Optional[str], list[_EmojiInfo]] = {}
 
-    for category_item in category_content:
+    for category_item in _ReadCategoryData():
         category_name = category_item["category"]
 
         these_emojis: list[_EmojiInfo] = []
@@ -316,6 +273,64 @@ def _CreateEmojiTables() -> dict[
     return results
 
 
+# ----------------------------------------------------------------------
+@functools.cache
+def _CreateSubstitutions() -> dict[str, str]:
+    # Transform only needs the emojis and aliases, so build the substitutions directly from the
+    # data rather than creating (and categorizing) `_EmojiInfo` objects.
+    emojis: dict[str, str] = {}
+    substitutions: dict[str, str] = {}
+
+    for data in _ReadGitmojiData():
+        code = data["code"]
+        emoji = data["emoji"]
+
+        name = code.replace(":", "")
+        assert name not in substitutions, name
+
+        emojis[code] = emoji
+        substitutions[name] = emoji
+
+    # Aliases are expanded to the emoji followed by the alias name
+    for category_item in _ReadCategoryData():
+        for item in category_item["items"]:
+            emoji = emojis.get(item["code"], None)
+            assert emoji is not None, (category_item["category"], item["code"])
+
+            for alias in item["aliases"]:
+                assert alias not in substitutions, alias
+                substitutions[alias] = "{} [{}]".format(emoji, alias)
+
+    return substitutions
+
+
+# ----------------------------------------------------------------------
+def _ReadGitmojiData() -> list[dict[str, Any]]:
+    data_filename = Path(__file__).parent / "Gitmoji" / "gitmojis.json"
+    assert data_filename.is_file(), data_filename
+
+    with data_filename.open(
+        "r",
+        encoding="UTF-8",
+    ) as f:
+        data_content = json.load(f)
+
+    assert "gitmojis" in data_content, data_content.keys()
+    return data_content["gitmojis"]
+
+
+# ----------------------------------------------------------------------
+def _ReadCategoryData() -> list[dict[str, Any]]:
+    categories_filename = Path(__file__).parent / "categories.json"
+    assert categories_filename.is_file(), categories_filename
+
+    with categories_filename.open(
+        "r",
+        encoding="UTF-8",
+    ) as f:
+        return json.load(f)
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
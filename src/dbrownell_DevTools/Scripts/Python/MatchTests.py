@@ -13,17 +13,17 @@
 # ----------------------------------------------------------------------
 """Matches tests with source files."""
 
+import fnmatch
 import os
 import re
 
 from dataclasses import dataclass
 from pathlib import Path, PurePath
-from typing import Annotated, Optional, Protocol
+from typing import Annotated, Callable, Optional, Protocol
 
 import typer
 
 from dbrownell_Common.InflectEx import inflect  # type: ignore[import-untyped]
-from dbrownell_Common import PathEx  # type: ignore[import-untyped]
 from dbrownell_Common.Streams.DoneManager import DoneManager, Flags as DoneManagerFlags  # type: ignore[import-untyped]
 from typer.core import TyperGroup
 
@@ -109,12 +109,16 @@ def MatchTests(
             f"Collecting source files in '{source_dir}'...",
             lambda: "{} found".format(inflect.no("file", len(source_files))),
         ):
+            # The files are all descendants of the source dir, so the relative path can be
+            # created by slicing the string rather than comparing the parts of both paths.
+            source_dir_prefix_len = len(os.path.join(source_dir, ""))
+
             for source_file in _CollectFiles(
                 source_dir,
                 include_globs,
                 exclude_globs,
             ):
-                source_files[PathEx.CreateRelativePath(source_dir, source_file)] = source_file
+                source_files[PurePath(str(source_file)[source_dir_prefix_len:])] = source_file
 
         for func in _TEST_DISCOVERY_FUNCTIONS:
             test_file_infos = func(dm, working_dir, source_dir, test_dir_name)
@@ -127,15 +131,16 @@ def MatchTests(
             for tfi in test_file_infos:
                 test_files[tfi.source_filename] = tfi
 
-            # Match the source and tests
-            matched: dict[PurePath, Optional[PurePath]] = {}
+            # Match the source and tests (matched tests are removed from `test_files`)
+            matched: dict[PurePath, PurePath] = {}
+            missing_tests: list[PurePath] = []
 
             with dm.Nested("Matching tests..."):
-                for relative_path in source_files.keys():
+                for relative_path in source_files:
                     matching_test = test_files.pop(relative_path, None)
 
                     if matching_test is None:
-                        matched[relative_path] = None
+                        missing_tests.append(relative_path)
                     else:
                         matched[relative_path] = matching_test.relative_filename
 
@@ -151,17 +156,10 @@ def MatchTests(
                     suffix="\n",
                 ) as matching_dm:
                     for source_file, test_file in matched.items():
-                        if test_file is not None:
-                            matching_dm.WriteLine(f"{source_file} ->\n{test_file}\n\n")
-                            matched_count += 1
+                        matching_dm.WriteLine(f"{source_file} ->\n{test_file}\n\n")
+                        matched_count += 1
 
             # Missing
-            missing_tests: list[PurePath] = []
-
-            for source_file, test_file in matched.items():
-                if test_file is None:
-                    missing_tests.append(source_file)
-
             if missing_tests:
                 with dm.Nested(
                     "{} missing tests...".format(inflect.no("source file", len(missing_tests))),
@@ -190,7 +188,7 @@ def MatchTests(
 # |  Private Types
 # |
 # ----------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class _TestInfo:
     test_filename: Path
     relative_filename: PurePath
@@ -229,12 +227,12 @@ def _TestDirDiscovery(
         f"Collecting test files in '{tests_dir}'...",
         lambda: "{} found".format(inflect.no("file", len(results))),
     ):
-        test_filename_regex = re.compile(r"^(?P<name>.+)_(?P<testtype>.+)Test\.py$")
+        tests_dir_prefix_len = len(os.path.join(tests_dir, ""))
 
         for filename in _CollectFiles(tests_dir):
-            relative_path = PathEx.CreateRelativePath(tests_dir, filename)
+            relative_path = PurePath(str(filename)[tests_dir_prefix_len:])
 
-            match = test_filename_regex.match(relative_path.name)
+            match = _TEST_FILENAME_REGEX.match(relative_path.name)
             if match:
                 source_path = relative_path.parent / f"{match.group('name')}.py"
             else:
@@ -251,31 +249,110 @@ def _CollectFiles(
     include_globs: Optional[list[str]] = None,
     exclude_globs: Optional[list[str]] = None,
 ) -> list[Path]:
+    is_excluded: Callable[[PurePath], bool] = (
+        _CreateGlobMatcher(exclude_globs) if exclude_globs else lambda _: False
+    )
+    is_included: Callable[[PurePath], bool] = (
+        _CreateGlobMatcher(include_globs) if include_globs else lambda _: True
+    )
+
     results: list[Path] = []
 
-    for root, _, filenames in os.walk(path):
-        if not filenames:
-            continue
+    # ----------------------------------------------------------------------
+    def Impl(
+        directory: str,
+    ) -> None:
+        # Work with the raw entries and only create `Path` objects for potential results
+        these_results: list[Path] = []
+        subdirectories: list[str] = []
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Consistent with `os.walk`, don't follow symlinks to directories
+                        if not entry.is_symlink():
+                            subdirectories.append(entry.path)
+
+                        continue
+
+                    # Equivalent to `Path.suffix == ".py"`, as the file ".py" doesn't have a suffix
+                    if not entry.name.endswith(".py") or entry.name in (".py", "__init__.py"):
+                        continue
+
+                    fullpath = Path(entry.path)
+
+                    if is_excluded(fullpath) or not is_included(fullpath):
+                        continue
+
+                    these_results.append(fullpath)
+        except OSError:
+            # Consistent with `os.walk`, skip directories that can't be read
+            return
 
-        root_path = Path(root)
+        results.extend(these_results)
 
-        for filename in filenames:
-            fullpath = root_path / filename
+        # Consistent with `os.walk`, process the files in a directory before its subdirectories
+        for subdirectory in subdirectories:
+            Impl(subdirectory)
 
-            if fullpath.suffix != ".py":
-                continue
+    # ----------------------------------------------------------------------
 
-            if fullpath.name == "__init__.py":
-                continue
+    Impl(str(path))
 
-            if (exclude_globs and any(fullpath.match(glob) for glob in exclude_globs)) or (
-                (include_globs and not any(fullpath.match(glob) for glob in include_globs))
+    return results
+
+
+# ----------------------------------------------------------------------
+def _CreateGlobMatcher(
+    globs: list[str],
+) -> Callable[[PurePath], bool]:
+    """\
+    Returns a function that returns True if a path matches any of the globs (using the same rules as
+    `PurePath.match`); each glob is parsed and compiled once rather than for every path.
+    """
+
+    regex_flags = re.IGNORECASE if os.name == "nt" else 0
+
+    patterns: list[tuple[bool, list[re.Pattern]]] = []
+
+    for glob in globs:
+        glob_path = PurePath(glob)
+
+        patterns.append(
+            (
+                bool(glob_path.anchor),
+                [
+                    re.compile(fnmatch.translate(part), regex_flags)
+                    for part in reversed(glob_path.parts)
+                ],
+            ),
+        )
+
+    # ----------------------------------------------------------------------
+    def Impl(
+        path: PurePath,
+    ) -> bool:
+        path_parts = path.parts
+
+        for is_absolute, part_regexes in patterns:
+            # Relative globs match from the right; absolute globs must match the entire path
+            if len(part_regexes) > len(path_parts) or (
+                is_absolute and len(part_regexes) != len(path_parts)
             ):
                 continue
 
-            results.append(fullpath)
+            if all(
+                part_regex.match(path_part)
+                for part_regex, path_part in zip(part_regexes, reversed(path_parts))
+            ):
+                return True
 
-    return results
+        return False
+
+    # ----------------------------------------------------------------------
+
+    return Impl
 
 
 # ----------------------------------------------------------------------
@@ -285,6 +362,8 @@ _TEST_DISCOVERY_FUNCTIONS: list[_TestDiscoveryFunction] = [
     _TestDirDiscovery,
 ]
 
+_TEST_FILENAME_REGEX = re.compile(r"^(?P<name>.+)_.+Test\.py$")
+
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -37,7 +37,6 @@ if os.getenv(IS_COGGING_ENVVAR_NAME, None) is None:
 
     import typer
 
-    from cogapp import Cog  # type: ignore[import-untyped]
     from dbrownell_Common.ContextlibEx import ExitStack  # type: ignore[import-untyped]
     from dbrownell_Common.Streams.DoneManager import (  # type: ignore[import-untyped]
         DoneManager,
@@ -45,6 +44,42 @@ if os.getenv(IS_COGGING_ENVVAR_NAME, None) is None:
     )
     from typer.core import TyperGroup
 
+    # The directory that contains this file, which cog uses to import this module
+    _COG_INCLUDE_DIR = str(Path(__file__).parent)
+
+    _LAUNCH_JSON_TEMPLATE = textwrap.dedent(
+        """\
+        {
+            // Use IntelliSense to learn about possible attributes.
+            // Hover to view descriptions of existing attributes.
+            // For more information, visit: https://go.microsoft.com/fwlink/?linkid=830387
+            "version": "0.2.0",
+            "configurations": [
+                // [[[cog import VSCodeTests]]]
+                // [[[end]]]
+            ]
+        }
+        """,
+    )
+
+    _NO_COG_CONTENT_TEMPLATE = textwrap.dedent(
+        """\
+        Cog content was not found in '{filename}'.
+
+        Ensure that these statements appear in the file:
+
+            {{
+                ...
+                "configurations": [
+                    // [[[cog import VSCodeTests]]]
+                    // [[[end]]]
+                ]
+                ...
+            }}
+
+        """,
+    )
+
     # ----------------------------------------------------------------------
     class NaturalOrderGrouper(TyperGroup):
         # pylint: disable=missing-class-docstring
@@ -82,6 +117,9 @@ if os.getenv(IS_COGGING_ENVVAR_NAME, None) is None:
             typer.Option("--debug", help="Write debug information to the terminal."),
         ] = False,
     ) -> None:
+        # Importing cogapp is relatively expensive and only needed here (and not for `--help`)
+        from cogapp import Cog  # type: ignore[import-untyped]
+
         with DoneManager.CreateCommandLine(
             flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
         ) as dm:
@@ -92,23 +130,7 @@ if os.getenv(IS_COGGING_ENVVAR_NAME, None) is None:
                 with dm.Nested("Creating 'launch.json'..."):
                     launch_json_filename.parent.mkdir(parents=True, exist_ok=True)
 
-                    with launch_json_filename.open("w") as f:
-                        f.write(
-                            textwrap.dedent(
-                                """\
-                                {
-                                    // Use IntelliSense to learn about possible attributes.
-                                    // Hover to view descriptions of existing attributes.
-                                    // For more information, visit: https://go.microsoft.com/fwlink/?linkid=830387
-                                    "version": "0.2.0",
-                                    "configurations": [
-                                        // [[[cog import VSCodeTests]]]
-                                        // [[[end]]]
-                                    ]
-                                }
-                                """,
-                            ),
-                        )
+                    launch_json_filename.write_text(_LAUNCH_JSON_TEMPLATE)
 
             with dm.Nested(f"Updating '{launch_json_filename}'...") as cog_dm:
                 # Launch cog
@@ -130,7 +152,7 @@ if os.getenv(IS_COGGING_ENVVAR_NAME, None) is None:
                             "-r",  # Replace
                             "--verbosity=0",
                             "-I",
-                            str(Path(__file__).parent),
+                            _COG_INCLUDE_DIR,
                             str(launch_json_filename),
                         ],
                     )
@@ -138,31 +160,15 @@ if os.getenv(IS_COGGING_ENVVAR_NAME, None) is None:
                     output = sink.getvalue()
 
                     if result == 0:
-                        lines = output.rstrip().split("\n")
+                        last_line = output.rstrip().rpartition("\n")[2]
 
-                        if lines[-1].startswith("Warning:"):
+                        if last_line.startswith("Warning:"):
                             result = 1
 
                         if result != 0:
                             if "no cog code found in" in output:
                                 cog_dm.WriteError(
-                                    textwrap.dedent(
-                                        f"""\
-                                        Cog content was not found in '{launch_json_filename}'.
-
-                                        Ensure that these statements appear in the file:
-
-                                            {{
-                                                ...
-                                                "configurations": [
-                                                    // [[[cog import VSCodeTests]]]
-                                                    // [[[end]]]
-                                                ]
-                                                ...
-                                            }}
-
-                                        """,
-                                    ),
+                                    _NO_COG_CONTENT_TEMPLATE.format(filename=launch_json_filename),
                                 )
                             else:
                                 cog_dm.WriteError(output)
@@ -178,7 +184,6 @@ if os.getenv(IS_COGGING_ENVVAR_NAME, None) is None:
 else:
     # If here, this script was invoked by cog.
 
-    import re
     import textwrap
 
     from pathlib import Path
@@ -186,6 +191,48 @@ else:
     import cog
     from dbrownell_Common import PathEx  # type: ignore[import-untyped]
 
+    # ----------------------------------------------------------------------
+    _LAUNCH_CONFIGURATION_TEMPLATE = textwrap.dedent(
+        """\
+        {{
+            // {filename}
+            "name": "{name}",
+
+            "presentation": {{
+                "hidden": false,
+                "group": "{group}",
+            }},
+
+            "type": "debugpy",
+            "request": "launch",
+            "justMyCode": false,
+            "console": "integratedTerminal",
+
+            "module": "pytest",
+            "cwd": "{dirname}",
+
+            "args": [
+                "-o",
+                "python_files=*Test.py",
+                "-vv",
+                "{basename}",
+
+                "--capture=no",  // Do not capture stderr/stdout
+
+                // To run a test method within a class, use the following expression
+                // with the `-k` argument that follows:
+                //
+                //      <class_name> and <test_name> [and not <other_test_name>]
+                //
+
+                // "-k", "test_name or expression",
+
+                // Insert custom debugger args here
+            ],
+        }},
+        """,
+    ).rstrip()
+
     # ----------------------------------------------------------------------
     def CogEntryPoint():
         working_dir_str = os.getenv(IS_COGGING_ENVVAR_NAME)
@@ -194,71 +241,74 @@ else:
         working_dir = Path(working_dir_str)
 
         # Discover tests
-        test_name_regex = re.compile(r"^.+_.+Test.py")
-
         test_filenames: list[Path] = []
 
-        for root, _, filenames in os.walk(working_dir):
-            root_path = Path(root)
+        # ----------------------------------------------------------------------
+        def Impl(
+            directory: str,
+        ) -> None:
+            subdirectories: list[str] = []
+
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Hidden directories (.git, .venv, etc.) won't contain tests of interest
+                            if not entry.name.startswith("."):
+                                subdirectories.append(entry.path)
+
+                            continue
+
+                        # Equivalent to matching `^.+_.+Test\.py$`
+                        if (
+                            entry.name.endswith("Test.py")
+                            and "_" in entry.name[1 : -len("Test.py") - 1]
+                        ):
+                            test_filenames.append(Path(entry.path))
+            except OSError:
+                return
+
+            # Consistent with `os.walk`, process the files in a directory before its subdirectories
+            for subdirectory in subdirectories:
+                Impl(subdirectory)
+
+        # ----------------------------------------------------------------------
 
-            for filename in filenames:
-                if not test_name_regex.match(filename):
-                    continue
+        Impl(str(working_dir))
 
-                test_filenames.append(root_path / filename)
+        # Many tests share the same directory, so only calculate the directory strings once
+        directory_info: dict[Path, tuple[str, str]] = {}
+
+        configurations: list[str] = []
 
         for test_filename in test_filenames:
-            cog.outl(
-                textwrap.dedent(
-                    """\
-                    {{
-                        // {filename}
-                        "name": "{name}",
-
-                        "presentation": {{
-                            "hidden": false,
-                            "group": "{group}",
-                        }},
-
-                        "type": "debugpy",
-                        "request": "launch",
-                        "justMyCode": false,
-                        "console": "integratedTerminal",
-
-                        "module": "pytest",
-                        "cwd": "{dirname}",
-
-                        "args": [
-                            "-o",
-                            "python_files=*Test.py",
-                            "-vv",
-                            "{basename}",
-
-                            "--capture=no",  // Do not capture stderr/stdout
-
-                            // To run a test method within a class, use the following expression
-                            // with the `-k` argument that follows:
-                            //
-                            //      <class_name> and <test_name> [and not <other_test_name>]
-                            //
-
-                            // "-k", "test_name or expression",
-
-                            // Insert custom debugger args here
-                        ],
-                    }},
-                    """,
+            this_directory_info = directory_info.get(test_filename.parent, None)
+
+            if this_directory_info is None:
+                this_directory_info = (
+                    test_filename.parent.as_posix(),
+                    PathEx.CreateRelativePath(working_dir, test_filename.parent).as_posix(),
                 )
-                .rstrip()
-                .format(
+
+                directory_info[test_filename.parent] = this_directory_info
+
+            dirname, group = this_directory_info
+
+            configurations.append(
+                _LAUNCH_CONFIGURATION_TEMPLATE.format(
                     filename=test_filename.as_posix(),
-                    dirname=test_filename.parent.as_posix(),
+                    dirname=dirname,
                     basename=test_filename.name,
                     name=test_filename.stem,
-                    group=PathEx.CreateRelativePath(working_dir, test_filename.parent).as_posix(),
+                    group=group,
                 ),
             )
 
+        # Emit all of the configurations at once
+
+        if configurations:
+            cog.out("\n".join(configurations) + "\n")
+
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
@@ -75,16 +75,25 @@ def EntryPoint(
             if os.name == "nt":
                 scripts_dir = PathEx.EnsureDir(generated_dir / "Scripts")
 
-                for child in scripts_dir.iterdir():
-                    if child.is_file() and child.suffix == ".exe":
-                        binary_files.append(child.stem)
+                with os.scandir(scripts_dir) as entries:
+                    for entry in entries:
+                        # Equivalent to `Path.suffix == ".exe"`, as the file ".exe" doesn't have a suffix
+                        if entry.name.endswith(".exe") and entry.name != ".exe" and entry.is_file():
+                            binary_files.append(entry.name[: -len(".exe")])
 
             else:
                 scripts_dir = PathEx.EnsureDir(generated_dir / "bin")
 
-                for child in scripts_dir.iterdir():
-                    if child.is_file() and child.stat().st_mode & os.X_OK:
-                        binary_files.append(child.name)
+                # `DirEntry` caches the file type retrieved when the directory is read, so only
+                # the mode check requires a system call (and only for files).
+                with os.scandir(scripts_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.stat().st_mode & os.X_OK:
+                            binary_files.append(entry.name)
+
+            # Directory entries are returned in an arbitrary order; sort them so that the columns
+            # have a stable layout.
+            binary_files.sort()
 
         dm.WriteLine("\n\n")
 
@@ -13,11 +13,15 @@
 # ----------------------------------------------------------------------
 """End-to-end tests for BuildActivities.py"""
 
+import functools
 import os
 import re
+import shutil
+import subprocess
 import sys
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -33,19 +37,28 @@ from dbrownell_DevTools.BuildActivities import CreateDockerImage, StreamCommand
 
 # ----------------------------------------------------------------------
 def SkipCreateDockerImageDecorator():
-    should_skip = False
-    reason = ""
+    reason = _GetDockerSkipReason()
+
+    return pytest.mark.skipif(reason is not None, reason=reason or "")
+
+
+# ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _GetDockerSkipReason() -> Optional[str]:
+    """Returns the reason that docker tests should be skipped, or None if docker is usable."""
+
+    if shutil.which("docker") is None:
+        return "Docker is not installed"
 
     result = SubprocessEx.Run("docker info")
 
     if result.returncode != 0:
-        should_skip = True
-        reason = "Docker is not running"
-    elif os.name == "nt" and "OSType: windows" in result.output:
-        should_skip = True
-        reason = "Docker is configured to build windows containers"
+        return "Docker is not running"
+
+    if os.name == "nt" and "OSType: windows" in result.output:
+        return "Docker is configured to build windows containers"
 
-    return pytest.mark.skipif(should_skip, reason=reason)
+    return None
 
 
 # ----------------------------------------------------------------------
@@ -78,9 +91,7 @@ def test_CreateDockerImage():
                 with test_dm.Nested("Running container...") as run_dm:
                     with run_dm.Nested("Starting container..."):
                         # Start the container
-                        result = SubprocessEx.Run(
-                            f"docker run -itd --volume {repo_root}:/local {image_name}"
-                        )
+                        result = SubprocessEx.Run(f"docker run -itd {image_name}")
                         assert result.returncode == 0, result.output
 
                         container_id = result.output.strip()
@@ -115,31 +126,34 @@ def test_CreateDockerImage():
                             #
                             # There is almost certainly a better way to do this.
 
-                            # Check for the presence of files
-                            result = SubprocessEx.Run(f"docker exec {container_id} ls -al")
-                            assert result.returncode == 0, result.output
-                            assert "Activate.sh" in result.output
-                            assert "Deactivate.sh" in result.output
+                            # The probes are independent of each other, so run them in parallel
+                            # to overlap the docker CLI startup costs.
+                            with ThreadPoolExecutor(max_workers=2) as executor:
+                                # Check for the presence of files
+                                ls_future = executor.submit(
+                                    SubprocessEx.Run,
+                                    f"docker exec {container_id} ls -al",
+                                )
 
-                            # Copy Build.py locally
-                            copied_build_filename = f"Build.py-{container_id}"
+                                # Read Build.py from the container. `SubprocessEx.Run` normalizes
+                                # line endings, so capture the raw bytes instead.
+                                cat_future = executor.submit(
+                                    subprocess.run,
+                                    ["docker", "exec", container_id, "cat", "Build.py"],
+                                    capture_output=True,
+                                    check=False,
+                                )
 
-                            result = SubprocessEx.Run(
-                                f"docker exec {container_id} cp Build.py /local/{copied_build_filename}"
-                            )
-                            assert result.returncode == 0, result.output
+                            ls_result = ls_future.result()
 
-                            copied_build_filename = PathEx.EnsureFile(
-                                repo_root / copied_build_filename
-                            )
+                            assert ls_result.returncode == 0, ls_result.output
+                            assert "Activate.sh" in ls_result.output
+                            assert "Deactivate.sh" in ls_result.output
 
-                            with ExitStack(copied_build_filename.unlink):
-                                original_build_filename = PathEx.EnsureFile(repo_root / "Build.py")
+                            cat_result = cat_future.result()
 
-                                with copied_build_filename.open() as f:
-                                    copied_build_content = f.read()
+                            assert cat_result.returncode == 0, cat_result.stderr.decode("utf-8")
 
-                                with original_build_filename.open() as f:
-                                    original_build_content = f.read()
+                            original_build_filename = PathEx.EnsureFile(repo_root / "Build.py")
 
-                                assert copied_build_content == original_build_content
+                            assert cat_result.stdout == original_build_filename.read_bytes()
@@ -26,9 +26,12 @@ from dbrownell_Common.TestHelpers.StreamTestHelpers import GenerateDoneManagerAn
 from dbrownell_DevTools.BuildActivities import *
 
 
+# ----------------------------------------------------------------------
+_repo_root = Path(__file__).parent.parent
+
+
 # ----------------------------------------------------------------------
 def test_UpdateVersion(tmp_path):
-    repo_root = Path(__file__).parent.parent
     version_filename = tmp_path / "version.txt"
 
     with version_filename.open("w") as f:
@@ -48,79 +51,104 @@ def test_UpdateVersion(tmp_path):
 
     UpdateVersion(
         dm,
-        repo_root,
+        _repo_root,
         version_filename,
-        lambda content, semver: re.sub("__version__ = 0.0.0", f"__version__ = {semver}", content),
+        lambda content, semver: content.replace("__version__ = 0.0.0", f"__version__ = {semver}"),
     )
 
     with version_filename.open() as f:
         version_content = f.read()
 
-    match = re.match(
-        r"""(?#
-        )Before\n(?#
-        )__version__ = (?#
-        )(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)\n(?#
-        )After\n(?#
-        )""",
-        version_content,
-        flags=re.MULTILINE,
-    )
-    assert match
-    assert match.group("major") != "0" or match.group("minor") != "0" or match.group("patch") != "0"
+    prefix = "Before\n__version__ = "
+    suffix = "\nAfter\n"
+
+    assert version_content.startswith(prefix), version_content
+    assert version_content.endswith(suffix), version_content
+
+    version_parts = version_content[len(prefix) : -len(suffix)].split(".")
+
+    assert len(version_parts) == 3, version_content
+    assert all(part.isdigit() for part in version_parts), version_content
+    assert version_parts != ["0", "0", "0"]
 
     content = cast(str, next(dm_and_content))
 
 
 # ----------------------------------------------------------------------
-def test_SaveDockerImage():
-    with (
-        patch("dbrownell_DevTools.BuildActivities.SubprocessEx.Stream", return_value=0) as mock,
-        patch("dbrownell_Common.PathEx.GetSizeDisplay", side_effect=["1KB", "2KB"]),
-        patch.object(Path, "is_file", return_value=True),
-        patch.object(Path, "unlink", return_value=True),
-    ):
-        dm_and_content = GenerateDoneManagerAndContent(expected_result=0)
-
-        SaveDockerImage(
-            cast(DoneManager, next(dm_and_content)),
-            "the_docker_image_name",
-            Path("my_saved_image.tar.compressed"),
-        )
+class TestSaveDockerImage:
+    expected_output = textwrap.dedent(
+        """\
+        Heading...
+          Removing previous docker image...DONE! (0, <scrubbed duration>)
+          Saving docker image...DONE! (0, <scrubbed duration>, 1KB)
+
+          Removing previous compressed docker image...DONE! (0, <scrubbed duration>)
+          Compressing docker image...DONE! (0, <scrubbed duration>, 2KB)
+
+        DONE! (0, <scrubbed duration>)
+        """,
+    )
 
-        # Validate the commands
-        commands = [call.args[0] for call in mock.call_args_list]
+    # ----------------------------------------------------------------------
+    def test_Windows(self):
+        commands, output = self._Execute("nt")
 
-        assert len(commands) == 2
-        assert commands[0] == 'docker save --output "my_saved_image.tar" the_docker_image_name'
+        assert commands == [
+            'docker save --output "my_saved_image.tar" the_docker_image_name',
+            'PowerShell -Command "Compress-Archive -Path my_saved_image.tar -DestinationPath my_saved_image.tar.compressed"',
+        ]
 
-        if os.name == "nt":
-            assert (
-                commands[1]
-                == 'PowerShell -Command "Compress-Archive -Path my_saved_image.tar -DestinationPath my_saved_image.tar.compressed"'
-            )
-        else:
-            assert commands[1] == 'gzip --keep "my_saved_image.tar"'
+        assert output == self.expected_output
 
-        # Validate the output
-        content = cast(str, next(dm_and_content))
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        commands, output = self._Execute("posix")
 
-        assert content == textwrap.dedent(
-            """\
-            Heading...
-              Removing previous docker image...DONE! (0, <scrubbed duration>)
-              Saving docker image...DONE! (0, <scrubbed duration>, 1KB)
+        assert commands == [
+            'docker save --output "my_saved_image.tar" the_docker_image_name',
+            'gzip --keep "my_saved_image.tar"',
+        ]
 
-              Removing previous compressed docker image...DONE! (0, <scrubbed duration>)
-              Compressing docker image...DONE! (0, <scrubbed duration>, 2KB)
+        assert output == self.expected_output
 
-            DONE! (0, <scrubbed duration>)
-            """,
-        )
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Execute(os_name: str) -> tuple[list[str], str]:
+        # Create the path before patching `os.name`, as pathlib uses it to select the path type
+        output_filename = Path("my_saved_image.tar.compressed")
+
+        with (
+            patch("dbrownell_DevTools.BuildActivities.SubprocessEx.Stream", return_value=0) as mock,
+            patch("dbrownell_Common.PathEx.GetSizeDisplay", side_effect=["1KB", "2KB"]),
+            patch.object(Path, "is_file", return_value=True),
+            patch.object(Path, "unlink", return_value=True),
+        ):
+            dm_and_content = GenerateDoneManagerAndContent(expected_result=0)
+            dm = cast(DoneManager, next(dm_and_content))
+
+            with patch.object(os, "name", os_name):
+                SaveDockerImage(dm, "the_docker_image_name", output_filename)
+
+            return [call.args[0] for call in mock.call_args_list], cast(str, next(dm_and_content))
 
 
 # ----------------------------------------------------------------------
 class TestPushDockerImage:
+    expected_tag_push_delete_output = textwrap.dedent(
+        """\
+        Heading...
+          Tagging docker image...DONE! (0, <scrubbed duration>)
+
+          Pushing docker image...DONE! (0, <scrubbed duration>)
+
+          Deleting docker image...DONE! (0, <scrubbed duration>)
+
+        DONE! (0, <scrubbed duration>)
+        """,
+    )
+
     # ----------------------------------------------------------------------
     def test_UsernameError1(self):
         with pytest.raises(
@@ -186,18 +214,7 @@ class TestPushDockerImage:
             "docker image rm a_user/the_image",
         ]
 
-        assert output == textwrap.dedent(
-            """\
-            Heading...
-              Tagging docker image...DONE! (0, <scrubbed duration>)
-
-              Pushing docker image...DONE! (0, <scrubbed duration>)
-
-              Deleting docker image...DONE! (0, <scrubbed duration>)
-
-            DONE! (0, <scrubbed duration>)
-            """,
-        )
+        assert output == self.expected_tag_push_delete_output
 
     # ----------------------------------------------------------------------
     def test_WithUsernameNoDelete(self):
@@ -237,18 +254,7 @@ class TestPushDockerImage:
             "docker image rm ghcr.io/a_user/the_image",
         ]
 
-        assert output == textwrap.dedent(
-            """\
-            Heading...
-              Tagging docker image...DONE! (0, <scrubbed duration>)
-
-              Pushing docker image...DONE! (0, <scrubbed duration>)
-
-              Deleting docker image...DONE! (0, <scrubbed duration>)
-
-            DONE! (0, <scrubbed duration>)
-            """,
-        )
+        assert output == self.expected_tag_push_delete_output
 
     # ----------------------------------------------------------------------
     # ----------------------------------------------------------------------
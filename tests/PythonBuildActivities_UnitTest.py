@@ -22,6 +22,7 @@ from unittest.mock import patch
 
 from dbrownell_Common.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndContent
 from dbrownell_DevTools.PythonBuildActivities import *
+from dbrownell_DevTools.PythonBuildActivities import _LineBufferedStream
 import pytest
 
 
@@ -52,7 +53,7 @@ class TestBlack:
 
         assert len(args) == 2
         assert args[0] == 'black --check "{}"'.format(_repo_root)
-        assert not kwargs
+        assert kwargs == {"env": None}
 
         assert cast(str, next(dm_and_content)) == self.expected_output
 
@@ -70,7 +71,29 @@ class TestBlack:
 
         assert len(args) == 2
         assert args[0] == 'black "{}"'.format(_repo_root)
-        assert not kwargs
+        assert kwargs == {"env": None}
+
+        assert cast(str, next(dm_and_content)) == self.expected_output
+
+    # ----------------------------------------------------------------------
+    def test_CacheDir(self, tmp_path):
+        dm_and_content = GenerateDoneManagerAndContent(expected_result=0)
+
+        cache_dir = tmp_path / "cache"
+
+        args, kwargs = _PatchStream(
+            lambda: Black(
+                cast(DoneManager, next(dm_and_content)),
+                _repo_root,
+                cache_dir=cache_dir,
+            ),
+        )
+
+        assert len(args) == 2
+        assert args[0] == 'black --check "{}"'.format(_repo_root)
+        assert len(kwargs) == 1
+        assert kwargs["env"]["BLACK_CACHE_DIR"] == str(cache_dir)
+        assert cache_dir.is_dir()
 
         assert cast(str, next(dm_and_content)) == self.expected_output
 
@@ -87,7 +110,7 @@ class TestBlack:
 
         assert len(args) == 2
         assert args[0] == 'black --check --verbose "{}"'.format(_repo_root)
-        assert not kwargs
+        assert kwargs == {"env": None}
 
         assert (
             cast(str, next(dm_and_content))
@@ -127,7 +150,7 @@ class TestPylint:
 
         assert len(args) == 2
         assert args[0] == 'pylint --fail-under=9.5 "{}"'.format(_repo_root)
-        assert not kwargs
+        assert kwargs == {"env": None}
 
         assert cast(str, next(dm_and_content)) == self.expected_output
 
@@ -145,7 +168,29 @@ class TestPylint:
 
         assert len(args) == 2
         assert args[0] == 'pylint --fail-under=10 "{}"'.format(_repo_root)
-        assert not kwargs
+        assert kwargs == {"env": None}
+
+        assert cast(str, next(dm_and_content)) == self.expected_output
+
+    # ----------------------------------------------------------------------
+    def test_CacheDir(self, tmp_path):
+        dm_and_content = GenerateDoneManagerAndContent(expected_result=0)
+
+        cache_dir = tmp_path / "cache"
+
+        args, kwargs = _PatchStream(
+            lambda: Pylint(
+                cast(DoneManager, next(dm_and_content)),
+                _repo_root,
+                cache_dir=cache_dir,
+            ),
+        )
+
+        assert len(args) == 2
+        assert args[0] == 'pylint --fail-under=9.5 "{}"'.format(_repo_root)
+        assert len(kwargs) == 1
+        assert kwargs["env"]["PYLINTHOME"] == str(cache_dir)
+        assert cache_dir.is_dir()
 
         assert cast(str, next(dm_and_content)) == self.expected_output
 
@@ -162,7 +207,7 @@ class TestPylint:
 
         assert len(args) == 2
         assert args[0] == 'pylint --fail-under=9.5 --verbose "{}"'.format(_repo_root)
-        assert not kwargs
+        assert kwargs == {"env": None}
 
         assert (
             cast(str, next(dm_and_content))
@@ -200,7 +245,7 @@ class TestPytest:
         )
 
         assert len(args) == 2
-        assert args[0] == "pytest --benchmark-skip  --capture=no --verbose -vv  ."
+        assert args[0] == "pytest --benchmark-skip --capture=no --verbose -vv ."
         assert len(kwargs) == 1
         assert kwargs["cwd"] == _repo_root
 
@@ -222,7 +267,7 @@ class TestPytest:
         assert len(args) == 2
         assert (
             args[0]
-            == "pytest --benchmark-skip --cov=dbrownell_DevTools  --capture=no --verbose -vv  ."
+            == "pytest --benchmark-skip --cov=dbrownell_DevTools --capture=no --verbose -vv ."
         )
         assert len(kwargs) == 1
         assert kwargs["cwd"] == _repo_root
@@ -245,7 +290,7 @@ class TestPytest:
         assert len(args) == 2
         assert (
             args[0]
-            == "pytest --benchmark-skip --cov=dbrownell_DevTools --cov-fail-under=90  --capture=no --verbose -vv  ."
+            == "pytest --benchmark-skip --cov=dbrownell_DevTools --cov-fail-under=90 --capture=no --verbose -vv ."
         )
         assert len(kwargs) == 1
         assert kwargs["cwd"] == _repo_root
@@ -266,7 +311,7 @@ class TestPytest:
         )
 
         assert len(args) == 2
-        assert args[0] == "pytest  --capture=no --verbose -vv  ."
+        assert args[0] == "pytest --capture=no --verbose -vv ."
         assert len(kwargs) == 1
         assert kwargs["cwd"] == _repo_root
 
@@ -286,7 +331,7 @@ class TestPytest:
         )
 
         assert len(args) == 2
-        assert args[0] == "pytest --benchmark-skip  --capture=no --verbose -vv more args here ."
+        assert args[0] == "pytest --benchmark-skip --capture=no --verbose -vv more args here ."
         assert len(kwargs) == 1
         assert kwargs["cwd"] == _repo_root
 
@@ -313,7 +358,7 @@ class TestPackage:
         )
 
         assert len(args) == 2
-        assert args[0] == "python -m build "
+        assert args[0] == "python -m build"
         assert len(kwargs) == 1
         assert kwargs["cwd"] == _repo_root
 
@@ -341,7 +386,12 @@ class TestPublish:
     def test_Standard(self):
         dm_and_content = GenerateDoneManagerAndContent(expected_result=0)
 
-        with patch.object(Path, "is_dir", return_value=True):
+        with (
+            patch.object(Path, "is_dir", return_value=True),
+            patch.object(
+                Path, "glob", return_value=[_repo_root / "dist" / "foo-1.0-py3-none-any.whl"]
+            ),
+        ):
             args, kwargs = _PatchStream(
                 lambda: Publish(cast(DoneManager, next(dm_and_content)), _repo_root, "<token>"),
             )
@@ -349,7 +399,7 @@ class TestPublish:
         assert len(args) == 2
         assert (
             args[0]
-            == 'twine upload --repository-url https://test.PyPi.org/legacy/ --username __token__ --password <token> --non-interactive --disable-progress-bar  "dist/*.whl"'
+            == 'twine upload --repository-url https://test.PyPi.org/legacy/ --username __token__ --password <token> --non-interactive --disable-progress-bar "dist/foo-1.0-py3-none-any.whl"'
         )
         assert len(kwargs) == 1
         assert kwargs["cwd"] == _repo_root
@@ -366,7 +416,12 @@ class TestPublish:
     def test_Production(self):
         dm_and_content = GenerateDoneManagerAndContent(expected_result=0)
 
-        with patch.object(Path, "is_dir", return_value=True):
+        with (
+            patch.object(Path, "is_dir", return_value=True),
+            patch.object(
+                Path, "glob", return_value=[_repo_root / "dist" / "foo-1.0-py3-none-any.whl"]
+            ),
+        ):
             args, kwargs = _PatchStream(
                 lambda: Publish(
                     cast(DoneManager, next(dm_and_content)),
@@ -379,7 +434,7 @@ class TestPublish:
         assert len(args) == 2
         assert (
             args[0]
-            == 'twine upload --repository-url https://upload.PyPi.org/legacy/ --username __token__ --password <token> --non-interactive --disable-progress-bar  "dist/*.whl"'
+            == 'twine upload --repository-url https://upload.PyPi.org/legacy/ --username __token__ --password <token> --non-interactive --disable-progress-bar "dist/foo-1.0-py3-none-any.whl"'
         )
         assert len(kwargs) == 1
         assert kwargs["cwd"] == _repo_root
@@ -396,7 +451,12 @@ class TestPublish:
     def test_Verbose(self):
         dm_and_content = GenerateDoneManagerAndContent(expected_result=0, verbose=True)
 
-        with patch.object(Path, "is_dir", return_value=True):
+        with (
+            patch.object(Path, "is_dir", return_value=True),
+            patch.object(
+                Path, "glob", return_value=[_repo_root / "dist" / "foo-1.0-py3-none-any.whl"]
+            ),
+        ):
             args, kwargs = _PatchStream(
                 lambda: Publish(cast(DoneManager, next(dm_and_content)), _repo_root, "<token>"),
             )
@@ -404,7 +464,7 @@ class TestPublish:
         assert len(args) == 2
         assert (
             args[0]
-            == 'twine upload --repository-url https://test.PyPi.org/legacy/ --username __token__ --password <token> --non-interactive --disable-progress-bar --verbose "dist/*.whl"'
+            == 'twine upload --repository-url https://test.PyPi.org/legacy/ --username __token__ --password <token> --non-interactive --disable-progress-bar --verbose "dist/foo-1.0-py3-none-any.whl"'
         )
         assert len(kwargs) == 1
         assert kwargs["cwd"] == _repo_root
@@ -413,7 +473,7 @@ class TestPublish:
             """\
             Heading...
               Publishing to 'https://test.PyPi.org/legacy/'...
-                VERBOSE: Command Line: twine upload --repository-url https://test.PyPi.org/legacy/ --username __token__ --password <token> --non-interactive --disable-progress-bar --verbose "dist/*.whl"
+                VERBOSE: Command Line: twine upload --repository-url https://test.PyPi.org/legacy/ --username __token__ --password <token> --non-interactive --disable-progress-bar --verbose "dist/foo-1.0-py3-none-any.whl"
 
               DONE! (0, <scrubbed duration>)
             DONE! (0, <scrubbed duration>)
@@ -440,6 +500,26 @@ class TestPublish:
                 "<token>",
             )
 
+    # ----------------------------------------------------------------------
+    def test_NoWheels(self, tmp_path):
+        (tmp_path / "dist").mkdir()
+
+        with pytest.raises(
+            DoneManagerException,
+            match=re.escape(
+                "No wheels were found in '{}'. Please make sure that the package has been built before invoking this functionality.".format(
+                    tmp_path / "dist"
+                )
+            ),
+        ):
+            dm_and_content = GenerateDoneManagerAndContent(expected_result=-1)
+
+            Publish(
+                cast(DoneManager, next(dm_and_content)),
+                tmp_path,
+                "<token>",
+            )
+
 
 # ----------------------------------------------------------------------
 class TestBuildBinary:
@@ -525,6 +605,30 @@ class TestBuildBinary:
         )
 
 
+# ----------------------------------------------------------------------
+class TestLineBufferedStream:
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        dm_and_content = GenerateDoneManagerAndContent(expected_result=0)
+
+        dm = cast(DoneManager, next(dm_and_content))
+
+        with dm.YieldStream() as stream:
+            dm.result = SubprocessEx.Stream(
+                "python -c \"import sys; sys.stdout.write('one\\ntwo\\nthree')\"",
+                _LineBufferedStream(stream),
+            )
+
+        assert cast(str, next(dm_and_content)) == textwrap.dedent(
+            """\
+            Heading...
+              one
+              two
+              threeDONE! (0, <scrubbed duration>)
+            """,
+        )
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
@@ -13,10 +13,14 @@
 # ----------------------------------------------------------------------
 """Unit tests for dbrownell_DevTools.RepoBuildTools.Python.py."""
 
+import threading
+import time
+
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
+import pytest
 import typer
 
 from dbrownell_DevTools.RepoBuildTools.Python import *
@@ -39,9 +43,10 @@ def test_Black():
     assert result.stdout == ""
     assert len(args) == 2
     assert args[1] == Path.cwd()
-    assert len(kwargs) == 2
+    assert len(kwargs) == 3
     assert kwargs["format_sources"] == False
     assert kwargs["args"] is None
+    assert kwargs["cache_dir"] is None
 
 
 # ----------------------------------------------------------------------
@@ -60,9 +65,29 @@ def test_BlackWithArgs():
     assert result.stdout == ""
     assert len(args) == 2
     assert args[1] == Path.cwd()
-    assert len(kwargs) == 2
+    assert len(kwargs) == 3
     assert kwargs["format_sources"] == False
     assert kwargs["args"] == "1 2 3 four five six"
+    assert kwargs["cache_dir"] is None
+
+
+# ----------------------------------------------------------------------
+def test_BlackWithCacheDir(tmp_path):
+    app = typer.Typer()
+
+    BlackFuncFactory(Path.cwd(), app)
+
+    cache_dir = tmp_path / "cache"
+
+    result, args, kwargs = _PatchFunction(
+        "Black",
+        app,
+        ["--cache-dir", str(cache_dir)],
+    )
+
+    assert result.exit_code == 0
+    assert kwargs["args"] is None
+    assert kwargs["cache_dir"] == cache_dir
 
 
 # ----------------------------------------------------------------------
@@ -82,8 +107,9 @@ def test_Pylint():
     assert len(args) == 3
     assert args[1] == Path.cwd()
     assert args[2] == 10.0
-    assert len(kwargs) == 1
+    assert len(kwargs) == 2
     assert kwargs["args"] is None
+    assert kwargs["cache_dir"] is None
 
 
 # ----------------------------------------------------------------------
@@ -103,8 +129,28 @@ def test_PylintWithArgs():
     assert len(args) == 3
     assert args[1] == Path.cwd()
     assert args[2] == 10.0
-    assert len(kwargs) == 1
+    assert len(kwargs) == 2
     assert kwargs["args"] == "1 2 3 four five six"
+    assert kwargs["cache_dir"] is None
+
+
+# ----------------------------------------------------------------------
+def test_PylintWithCacheDir(tmp_path):
+    app = typer.Typer()
+
+    PylintFuncFactory(Path.cwd(), app, 10.0, "1 2 3")
+
+    cache_dir = tmp_path / "cache"
+
+    result, args, kwargs = _PatchFunction(
+        "Pylint",
+        app,
+        ["--cache-dir", str(cache_dir)],
+    )
+
+    assert result.exit_code == 0
+    assert kwargs["args"] == "1 2 3"
+    assert kwargs["cache_dir"] == cache_dir
 
 
 # ----------------------------------------------------------------------
@@ -155,11 +201,118 @@ def test_PytestWithArgs():
     assert kwargs["args"] == "1 2 3 four five six"
 
 
+# ----------------------------------------------------------------------
+def test_PytestWithJobs():
+    app = typer.Typer()
+
+    PytestFuncFactory(Path.cwd(), "foo", app, additional_args="1 2 3")
+
+    result, args, kwargs = _PatchFunction(
+        "Pytest",
+        app,
+        ["--jobs", "4"],
+    )
+
+    assert result.exit_code == 0
+    assert kwargs["args"] == "-n 4 --dist=loadfile 1 2 3"
+
+    result, args, kwargs = _PatchFunction(
+        "Pytest",
+        app,
+        ["-n", "auto"],
+    )
+
+    assert result.exit_code == 0
+    assert kwargs["args"] == "-n auto --dist=loadfile 1 2 3"
+
+    # Consistent with pytest-xdist, 0 disables parallel execution
+    result, args, kwargs = _PatchFunction(
+        "Pytest",
+        app,
+        ["-n", "0"],
+    )
+
+    assert result.exit_code == 0
+    assert kwargs["args"] == "1 2 3"
+
+    result, args, kwargs = _PatchFunction(
+        "Pytest",
+        app,
+        ["--jobs", "4", "--benchmark"],
+    )
+
+    assert result.exit_code == 0
+    assert kwargs["args"] == "1 2 3"
+
+
+# ----------------------------------------------------------------------
+def test_PytestWithInvalidJobs():
+    app = typer.Typer()
+
+    PytestFuncFactory(Path.cwd(), "foo", app)
+
+    with patch("dbrownell_DevTools.RepoBuildTools.Python.PythonBuildActivities.Pytest") as mock:
+        result = CliRunner().invoke(app, ["--jobs", "many"])
+
+    assert result.exit_code != 0
+    assert not mock.called
+
+
+# ----------------------------------------------------------------------
+def test_Check():
+    app = typer.Typer()
+
+    CheckFuncFactory(Path.cwd(), Path.cwd() / "src", "foo", app, default_min_score=10.0)
+
+    black_mock, pylint_mock, pytest_mock, result = _PatchCheck(app, [])
+
+    assert result.exit_code == 0
+
+    assert black_mock.call_args.args[1:] == (Path.cwd(),)
+    assert black_mock.call_args.kwargs == {"args": None}
+
+    assert pylint_mock.call_args.args[1:] == (Path.cwd() / "src", 10.0)
+    assert pylint_mock.call_args.kwargs == {"args": None}
+
+    assert pytest_mock.call_args.args[1:] == (Path.cwd(), "foo", None)
+    assert pytest_mock.call_args.kwargs == {"args": None, "code_coverage": False}
+
+
+# ----------------------------------------------------------------------
+def test_CheckWithConfiguration():
+    app = typer.Typer()
+
+    CheckFuncFactory(
+        Path.cwd(),
+        Path.cwd() / "src",
+        "foo",
+        app,
+        default_min_coverage=80.0,
+        black_additional_args="black args",
+        pylint_additional_args="pylint args",
+        pytest_additional_args="pytest args",
+    )
+
+    black_mock, pylint_mock, pytest_mock, result = _PatchCheck(app, ["--code-coverage"])
+
+    assert result.exit_code == 0
+
+    assert black_mock.call_args.args[1:] == (Path.cwd(),)
+    assert black_mock.call_args.kwargs == {"args": "black args"}
+
+    assert pylint_mock.call_args.args[1:] == (Path.cwd() / "src", 9.5)
+    assert pylint_mock.call_args.kwargs == {"args": "pylint args"}
+
+    assert pytest_mock.call_args.args[1:] == (Path.cwd(), "foo", 80.0)
+    assert pytest_mock.call_args.kwargs == {"args": "pytest args", "code_coverage": True}
+
+
 # ----------------------------------------------------------------------
 def test_UpdateVersion():
     app = typer.Typer()
+    this_filename = Path(__file__)
 
-    UpdateVersionFuncFactory(Path(__file__).parent, Path(__file__), app)
+    UpdateVersionFuncFactory(this_filename.parent, this_filename, app)
 
     result, args, kwargs = _PatchFunction(
         "UpdateVersion",
@@ -171,8 +324,8 @@ def test_UpdateVersion():
     assert result.exit_code == 0
     assert result.stdout == ""
     assert len(args) == 4
-    assert args[1] == Path(__file__).parent
-    assert args[2] == Path(__file__)
+    assert args[1] == this_filename.parent
+    assert args[2] == this_filename
     assert not kwargs
 
 
@@ -318,6 +471,105 @@ def test_BuildBinaries():
     assert not mock.call_args_list[1].kwargs
 
 
+# ----------------------------------------------------------------------
+def test_BuildBinariesWithName():
+    app = typer.Typer()
+
+    BuildBinariesFuncFactory(
+        Path.cwd(),
+        {
+            "one": Path.cwd() / "one.py",
+            "two": Path.cwd() / "two.py",
+        },
+        app,
+    )
+
+    with patch(
+        "dbrownell_DevTools.RepoBuildTools.Python.PythonBuildActivities.BuildBinary",
+    ) as mock:
+        result = CliRunner().invoke(app, ["two"])
+
+    assert result.exit_code == 0
+    assert len(mock.call_args_list) == 1
+    assert mock.call_args_list[0].args[1] == Path.cwd() / "two.py"
+
+
+# ----------------------------------------------------------------------
+def test_BuildBinariesParallel():
+    app = typer.Typer()
+
+    BuildBinariesFuncFactory(
+        Path.cwd(),
+        {
+            "one": Path.cwd() / "one" / "one.py",
+            "two": Path.cwd() / "two" / "two.py",
+        },
+        app,
+    )
+
+    with patch(
+        "dbrownell_DevTools.RepoBuildTools.Python.PythonBuildActivities.BuildBinary",
+    ) as mock:
+        result = CliRunner().invoke(app, ["--jobs", "2"])
+
+    assert result.exit_code == 0
+    assert result.stdout == ""
+
+    # The binaries are built concurrently, so the calls may arrive in any order
+    assert sorted((call.args[1], call.args[2]) for call in mock.call_args_list) == [
+        (Path.cwd() / "one" / "one.py", Path.cwd() / "build" / "one"),
+        (Path.cwd() / "two" / "two.py", Path.cwd() / "build" / "two"),
+    ]
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "build_filenames",
+    [
+        # cx_Freeze uses the same 'build' directory for both files
+        {"one": Path.cwd() / "src" / "one.py", "two": Path.cwd() / "src" / "two.py"},
+        # 'one' is built in the directory that contains the output directories
+        {"one": Path.cwd() / "one.py", "two": Path.cwd() / "src" / "two.py"},
+    ],
+)
+def test_BuildBinariesParallelSharedDirectory(build_filenames):
+    app = typer.Typer()
+
+    BuildBinariesFuncFactory(Path.cwd(), build_filenames, app)
+
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def BuildBinary(*args, **kwargs):
+        nonlocal active, max_active
+
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+
+        time.sleep(0.1)
+
+        with lock:
+            active -= 1
+
+    # ----------------------------------------------------------------------
+
+    with patch(
+        "dbrownell_DevTools.RepoBuildTools.Python.PythonBuildActivities.BuildBinary",
+        side_effect=BuildBinary,
+    ) as mock:
+        result = CliRunner().invoke(app, ["--jobs", "2"])
+
+    assert result.exit_code == 0
+    assert max_active == 1
+    assert [call.args[1] for call in mock.call_args_list] == [
+        build_filenames["one"],
+        build_filenames["two"],
+    ]
+
+
 # ----------------------------------------------------------------------
 def test_CreateDockerImage():
     app = typer.Typer()
@@ -365,3 +617,22 @@ def _PatchFunction(
         result = CliRunner().invoke(app, args)
 
         return result, mock.call_args.args, mock.call_args.kwargs
+
+
+# ----------------------------------------------------------------------
+def _PatchCheck(
+    app: typer.Typer,
+    args: list[str],
+) -> tuple[Any, Any, Any, Any]:
+    with (
+        patch("dbrownell_DevTools.RepoBuildTools.Python.PythonBuildActivities.Black") as black_mock,
+        patch(
+            "dbrownell_DevTools.RepoBuildTools.Python.PythonBuildActivities.Pylint"
+        ) as pylint_mock,
+        patch(
+            "dbrownell_DevTools.RepoBuildTools.Python.PythonBuildActivities.Pytest"
+        ) as pytest_mock,
+    ):
+        result = CliRunner().invoke(app, args)
+
+    return black_mock, pylint_mock, pytest_mock, result
@@ -0,0 +1,39 @@
+# ----------------------------------------------------------------------
+# |
+# |  MatchTests_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-15 10:12:43
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for MatchTests.py."""
+
+from pathlib import Path
+
+from dbrownell_DevTools.Scripts.Python.MatchTests import _CreateGlobMatcher
+
+
+# ----------------------------------------------------------------------
+def test_GlobMatcher():
+    globs = ["*.py", "foo/b?r.txt", "/root/*.cfg", "[!x]*.md"]
+
+    is_match = _CreateGlobMatcher(globs)
+
+    for path in [
+        Path("/a/b/c.py"),
+        Path("/a/foo/bar.txt"),
+        Path("/a/foo/baz.txt"),
+        Path("/a/food/bar.txt"),
+        Path("/root/setup.cfg"),
+        Path("/root/a/setup.cfg"),
+        Path("/a/readme.md"),
+        Path("/a/xreadme.md"),
+        Path("c.py"),
+        Path("bar.txt"),
+    ]:
+        assert is_match(path) == any(path.match(glob) for glob in globs), path
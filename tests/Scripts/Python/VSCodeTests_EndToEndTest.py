@@ -13,18 +13,25 @@
 # ----------------------------------------------------------------------
 """End-to-end tests for VSCodeTests.py."""
 
-from pathlib import Path
-
-from dbrownell_Common import PathEx
 from typer.testing import CliRunner
 
 from dbrownell_DevTools.Scripts.Python.VSCodeTests import app
 
 
 # ----------------------------------------------------------------------
-def test_Standard():
-    repo_root = PathEx.EnsureDir(Path(__file__).parent.parent.parent.parent)
+def test_Standard(tmp_path):
+    (tmp_path / "tests" / "Sub").mkdir(parents=True)
+
+    (tmp_path / "tests" / "One_UnitTest.py").touch()
+    (tmp_path / "tests" / "Sub" / "Two_EndToEndTest.py").touch()
+    (tmp_path / "tests" / "NotATest.py").touch()
 
-    result = CliRunner().invoke(app, [str(repo_root)])
+    result = CliRunner().invoke(app, [str(tmp_path)])
 
     assert result.exit_code == 0, result.output
+
+    content = (tmp_path / ".vscode" / "launch.json").read_text()
+
+    assert '"name": "One_UnitTest",' in content
+    assert '"name": "Two_EndToEndTest",' in content
+    assert "NotATest" not in content